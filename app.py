@@ -2,7 +2,6 @@
 import streamlit as st
 import os
 import json
-import pandas as pd
 from src.performance_monitor.crew import PerformanceMonitorCrew
 
 st.set_page_config(
@@ -229,6 +228,7 @@ if st.session_state.analysis_result:
 
         st.markdown("<br>", unsafe_allow_html=True)
         st.markdown("<h3>📋 Detailed Analysis Data</h3>", unsafe_allow_html=True)
+        import pandas as pd  # Only needed once there are results to tabulate
         tab1, tab2, tab3 = st.tabs(["Performance", "SEO", "Accessibility"])
 
         with tab1:
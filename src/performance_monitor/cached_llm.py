@@ -0,0 +1,83 @@
+# src/performance_monitor/cached_llm.py
+import logging
+import sqlite3
+from typing import Any, Dict, List, Optional, Union
+
+from crewai.llms.base_llm import BaseLLM
+
+from src.performance_monitor.llm_cache import LLMResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedLLM(BaseLLM):
+    """crewAI LLM that answers repeated prompts from an LLMResponseCache.
+
+    Misses are forwarded unchanged to the wrapped crewAI LLM, so the same
+    client, callbacks and token accounting are used with or without the cache.
+    Only prompts that are byte-for-byte identical hit: steps whose prompts
+    embed live measurements (e.g. BrowserTool load times) always miss.
+    """
+
+    def __init__(self, llm: BaseLLM, cache: LLMResponseCache, provider: str):
+        super().__init__(model=llm.model, temperature=llm.temperature)
+        self.llm = llm
+        self.cache = cache
+        self.provider = provider
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        # crewAI's executor sets stop words on the LLM it was given
+        self.llm.stop = self.stop
+
+        # Native function calls execute tools, so their results are never cached
+        cacheable = not tools and not available_functions
+        if cacheable:
+            # Stop words are part of the request, so they belong in the key too.
+            # The executor builds them from a set, hence the sort.
+            key = self.cache.make_key(
+                self.provider, self.model, self.temperature,
+                {"messages": messages, "stop": sorted(self.stop or [])}
+            )
+            try:
+                cached = self.cache.get(key)
+            except (OSError, sqlite3.Error) as e:
+                # A locked or broken cache must never fail the LLM step
+                logger.warning(f"LLM cache lookup failed, calling the LLM: {e}")
+                self.cache.misses += 1
+                cached = None
+            if cached is not None:
+                logger.info(f"LLM cache hit for {self.provider}/{self.model}")
+                return cached
+
+        response = self.llm.call(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+        )
+
+        if cacheable and isinstance(response, str) and response:
+            try:
+                self.cache.set(key, response)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"LLM cache write skipped: {e}")
+        return response
+
+    def supports_function_calling(self) -> bool:
+        return self.llm.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self.llm.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.llm.get_context_window_size()
@@ -1,12 +1,13 @@
 import yaml
 import os
+import logging
 from pathlib import Path
-from crewai import Agent, Task, Crew, Process
-from langchain_openai import ChatOpenAI
-from langchain_google_genai import ChatGoogleGenerativeAI
-from crewai_tools import SerperDevTool
 
-from src.performance_monitor.tools.custom_tool import SiteMapTool, BrowserTool, ScraperTool
+# crewAI, the LLM provider clients and the tools are imported on demand so that
+# importing this module (from main.py or app.py) stays cheap. Only the selected
+# provider's client is ever loaded.
+
+logger = logging.getLogger(__name__)
 
 class PerformanceMonitorCrew:
     def __init__(self, url: str):
@@ -14,15 +15,36 @@ class PerformanceMonitorCrew:
         config_path = Path(__file__).parent / 'config'
         self.agents_config = self._load_yaml(config_path / 'agents.yaml')
         self.tasks_config = self._load_yaml(config_path / 'tasks.yaml')
+        self.llm_cache = self._get_llm_cache()
         self.llm = self._get_llm()
 
     def _load_yaml(self, path: Path):
         with open(path, 'r') as file:
             return yaml.safe_load(file)
 
+    def _get_llm_cache(self):
+        from src.performance_monitor.llm_cache import LLMResponseCache
+
+        return LLMResponseCache.from_env()
+
     def _get_llm(self):
-        """Initialize the appropriate LLM based on environment variables."""
+        """Initialize the appropriate LLM, wrapped in the response cache when enabled."""
         provider = os.getenv("LLM_PROVIDER", "gemini").lower()  # Default to gemini
+        llm = self._create_provider_llm(provider)
+
+        if self.llm_cache is None:
+            return llm
+
+        # Convert to a crewAI LLM exactly as Agent would without the cache, so
+        # both settings send requests through the same client
+        from crewai.utilities.llm_utils import create_llm
+        from src.performance_monitor.cached_llm import CachedLLM
+
+        return CachedLLM(create_llm(llm), self.llm_cache, provider=provider)
+
+    def _create_provider_llm(self, provider: str):
+        """Create the raw chat model for the given provider."""
+        temperature = 0.1
         
         if provider == "gemini":
             model_name = os.getenv("GEMINI_MODEL_NAME", "gemini-1.5-pro")
@@ -31,10 +53,12 @@ class PerformanceMonitorCrew:
             if not google_api_key:
                 raise ValueError("GOOGLE_API_KEY environment variable is required for Gemini")
             
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
             return ChatGoogleGenerativeAI(
                 model=model_name,
                 google_api_key=google_api_key,
-                temperature=0.1,
+                temperature=temperature,
                 convert_system_message_to_human=True
             )
         elif provider == "openai":
@@ -44,16 +68,25 @@ class PerformanceMonitorCrew:
             if not openai_api_key:
                 raise ValueError("OPENAI_API_KEY environment variable is required for OpenAI")
             
+            from langchain_openai import ChatOpenAI
+
             return ChatOpenAI(
                 model=model_name,
                 openai_api_key=openai_api_key,
-                temperature=0.1
+                temperature=temperature
             )
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}. Use 'gemini' or 'openai'")
 
     def _get_tools(self):
         """Get available tools including optional Serper tool."""
+        from src.performance_monitor.tools.custom_tool import SiteMapTool, BrowserTool, ScraperTool
+        from src.performance_monitor.tools.html_parser import get_parser_pool
+
+        # Validates PARSER_WORKERS/PARSER_MAX_PENDING before the crew starts;
+        # worker processes are only started on the first crawl
+        get_parser_pool()
+
         tools = {
             'site_map': SiteMapTool(),
             'browser': BrowserTool(),
@@ -62,11 +95,15 @@ class PerformanceMonitorCrew:
         
         # Add Serper tool if API key is available
         if os.getenv("SERPER_API_KEY"):
+            from crewai_tools import SerperDevTool
+
             tools['search'] = SerperDevTool()
         
         return tools
 
     def run(self):
+        from crewai import Agent, Task, Crew, Process
+
         tools = self._get_tools()
         
         # Create agents with the configured LLM
@@ -131,14 +168,30 @@ class PerformanceMonitorCrew:
             context=[performance_task, seo_task]
         )
 
-        # Create and run crew
+        # Create and run crew. Memory adds context from previous runs to every
+        # prompt, so with memory on, repeat runs rarely hit the LLM cache.
+        memory = os.getenv("CREW_MEMORY_ENABLED", "true").lower() not in ("0", "false", "no", "off")
+        if memory and self.llm_cache is not None:
+            logger.info("Crew memory is enabled, so the LLM cache will rarely hit; set CREW_MEMORY_ENABLED=false to reuse responses")
+
         crew = Crew(
             agents=[site_crawler_agent, performance_analyst_agent, seo_auditor_agent, report_synthesizer_agent],
             tasks=[crawl_task, performance_task, seo_task, report_task],
             process=Process.sequential,
             verbose=True,
-            memory=True
+            memory=memory
         )
 
-        result = crew.kickoff(inputs={'url': self.url})
-        return result
\ No newline at end of file
+        try:
+            result = crew.kickoff(inputs={'url': self.url})
+        finally:
+            if self.llm_cache is not None:
+                self._log_cache_stats()
+                self.llm_cache.close()
+        return result
+
+    def _log_cache_stats(self):
+        try:
+            logger.info(f"LLM cache stats: {self.llm_cache.stats()}")
+        except Exception as e:
+            logger.warning(f"Could not read LLM cache stats: {e}")
\ No newline at end of file
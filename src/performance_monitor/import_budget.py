@@ -0,0 +1,92 @@
+# src/performance_monitor/import_budget.py
+"""Measure the import time of the CLI and Streamlit entry points against a budget.
+
+Run from the repository root:
+
+    python -m src.performance_monitor.import_budget
+
+Budgets (in milliseconds) can be overridden with IMPORT_BUDGET_MAIN_MS and
+IMPORT_BUDGET_APP_MS. The exit code is non-zero if any budget is exceeded.
+
+The matching test is timing-sensitive, so it only runs when asked for, in a
+separate, otherwise idle CI step:
+
+    IMPORT_BUDGET_ENFORCE=1 python -m pytest tests/test_import_budget.py
+"""
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Importing app.py runs the Streamlit script in "bare" mode, which is what a
+# cold rerun costs before any analysis is started. The defaults leave headroom
+# over typical measurements but fail if crewAI or a provider is imported eagerly.
+ENTRY_POINTS = {
+    "main": ("src.performance_monitor.main", "IMPORT_BUDGET_MAIN_MS", 150),
+    "app": ("app", "IMPORT_BUDGET_APP_MS", 1000),
+}
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _import_times(code: str) -> Dict[str, Tuple[int, int]]:
+    """Return {module: (cumulative_us, depth)} from `python -X importtime -c code`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        errors = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError("Import failed:\n" + "\n".join(errors[-10:]))
+
+    times = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            _, cumulative, indent, name = match.groups()
+            times[name] = (int(cumulative), (len(indent) - 1) // 2)
+    return times
+
+
+def measure(module: str) -> Tuple[float, List[Tuple[str, float]]]:
+    """Return the import time of `module` in ms, excluding interpreter startup, and its slowest imports."""
+    baseline = _import_times("pass")
+    times = _import_times(f"import {module}")
+
+    top_level = [
+        (name, cumulative / 1000)
+        for name, (cumulative, depth) in times.items()
+        if depth == 0 and name not in baseline
+    ]
+    top_level.sort(key=lambda item: item[1], reverse=True)
+    return sum(ms for _, ms in top_level), top_level[:5]
+
+
+def main() -> int:
+    over_budget = False
+    for label, (module, env_var, default_budget) in ENTRY_POINTS.items():
+        budget = float(os.getenv(env_var, default_budget))
+        try:
+            total, slowest = measure(module)
+        except RuntimeError as e:
+            print(f"❌ {label}: {e}")
+            over_budget = True
+            continue
+
+        ok = total <= budget
+        over_budget = over_budget or not ok
+        print(f"{'✅' if ok else '❌'} {label}: {total:.0f} ms (budget {budget:.0f} ms)")
+        for name, ms in slowest:
+            print(f"    {ms:8.1f} ms  {name}")
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+# src/performance_monitor/llm_cache.py
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "performance_monitor"
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60  # One week
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+DEFAULT_BUSY_TIMEOUT_SECONDS = 5.0
+
+
+class LLMResponseCache:
+    """On-disk, content-addressed store for LLM responses with TTL and size eviction.
+
+    The database is opened on first use and reopened after `close()`. Several
+    processes may share it; writers wait up to `busy_timeout` seconds for a lock.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT_SECONDS
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.busy_timeout = busy_timeout
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """The open connection, created on first use. Callers must hold self._lock."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=self.busy_timeout, check_same_thread=False)
+            try:
+                # WAL lets overlapping runs read while another one writes
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS responses (
+                        key TEXT PRIMARY KEY,
+                        response TEXT NOT NULL,
+                        size INTEGER NOT NULL,
+                        created_at REAL NOT NULL,
+                        accessed_at REAL NOT NULL
+                    )
+                """)
+                conn.commit()
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def open(self) -> None:
+        """Open the database now, raising OSError or sqlite3.Error if it is unusable."""
+        with self._lock:
+            self._db
+
+    @staticmethod
+    def make_key(provider: str, model: str, temperature: Optional[float], messages: Union[str, List[Dict[str, Any]]]) -> str:
+        """Build the cache key from the model identity and a hash of the prompt."""
+        prompt_hash = hashlib.sha256(
+            json.dumps(messages, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+        identity = json.dumps([provider, model, temperature, prompt_hash])
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock, self._db as db:  # Commits, or rolls back on error
+            row = db.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, response: str) -> None:
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        with self._lock, self._db as db:
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, response, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, response, size, now, now)
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones until under the size limit."""
+        if self.ttl_seconds:
+            self._db.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+
+        if not self.max_bytes:
+            return
+
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        stale_keys = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC"):
+            if total <= self.max_bytes:
+                break
+            stale_keys.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def clear(self) -> None:
+        with self._lock, self._db as db:
+            db.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "size_bytes": size,
+            "path": str(self.path)
+        }
+
+    @classmethod
+    def from_env(cls) -> Optional["LLMResponseCache"]:
+        """Create the cache from environment variables, or return None if disabled or unusable."""
+        if os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("0", "false", "no", "off"):
+            return None
+
+        cache_dir = Path(os.getenv("LLM_CACHE_DIR", str(DEFAULT_CACHE_DIR)))
+        ttl_seconds = float(os.getenv("LLM_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS))
+        max_bytes = int(float(os.getenv("LLM_CACHE_MAX_MB", DEFAULT_MAX_BYTES / (1024 * 1024))) * 1024 * 1024)
+        cache = cls(cache_dir / "llm_responses.sqlite3", ttl_seconds=ttl_seconds, max_bytes=max_bytes)
+
+        # The cache is an optimization: if it can't be used, run without it
+        try:
+            cache.open()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"LLM cache disabled, could not open {cache.path}: {e}")
+            return None
+        # Reopened on first use, so nothing is held open until a crew runs
+        cache.close()
+        return cache
@@ -2,12 +2,16 @@
 import requests
 import json
 import time
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from collections import deque
+from urllib.parse import urlparse
 from crewai.tools import BaseTool
-from playwright.sync_api import sync_playwright
 import logging
 
+from src.performance_monitor.tools.html_parser import analyze_page, extract_links, get_parser_pool
+
+# Playwright is imported inside BrowserTool._run, and BeautifulSoup inside the
+# html_parser functions, so they are only loaded once a tool is actually used.
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -22,80 +26,13 @@ class ScraperTool(BaseTool):
             }
             response = requests.get(url, timeout=15, headers=headers)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
 
-            title = soup.find('title')
-            title_text = title.get_text(strip=True) if title else 'Not Found'
-            title_length = len(title_text) if title_text != 'Not Found' else 0
-            
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            meta_description = meta_desc.get('content', '').strip() if meta_desc else 'Not Found'
-            meta_desc_length = len(meta_description) if meta_description != 'Not Found' else 0
-            
-            h1_tags = soup.find_all('h1')
-            h1_content = [h1.get_text(strip=True) for h1 in h1_tags]
-            
-            meta_robots = soup.find('meta', attrs={'name': 'robots'})
-            robots_content = meta_robots.get('content', '') if meta_robots else 'Not Found'
-            
-            og_title = soup.find('meta', property='og:title')
-            og_description = soup.find('meta', property='og:description')
-            og_image = soup.find('meta', property='og:image')
-            
-            images = soup.find_all('img')
-            images_without_alt = []
-            total_images = len(images)
-            
-            for img in images:
-                alt_text = img.get('alt', '').strip()
-                if not alt_text:
-                    src = img.get('src', 'Unknown source')
-                    images_without_alt.append(src)
-            
-            forms = soup.find_all('form')
-            inputs_without_labels = []
-            for form in forms:
-                inputs = form.find_all('input', type=['text', 'email', 'password', 'tel', 'url'])
-                for input_elem in inputs:
-                    input_id = input_elem.get('id')
-                    input_name = input_elem.get('name')
-                    if input_id:
-                        label = soup.find('label', attrs={'for': input_id})
-                        if not label:
-                            inputs_without_labels.append(input_id or input_name or 'Unknown input')
-            
-            headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-            heading_structure = []
-            for heading in headings:
-                heading_structure.append({
-                    'level': heading.name,
-                    'text': heading.get_text(strip=True)[:100]
-                })
+            # A single page gains nothing from the process pool, so parse inline
+            analysis = analyze_page(response.content)
 
             return json.dumps({
                 "url": url,
-                "seo_analysis": {
-                    "title": title_text,
-                    "title_length": title_length,
-                    "title_optimal": 30 <= title_length <= 60,
-                    "meta_description": meta_description,
-                    "meta_description_length": meta_desc_length,
-                    "meta_description_optimal": 120 <= meta_desc_length <= 160,
-                    "h1_count": len(h1_content),
-                    "h1_content": h1_content,
-                    "h1_optimal": len(h1_content) == 1,
-                    "robots_directive": robots_content,
-                    "has_og_title": og_title is not None,
-                    "has_og_description": og_description is not None,
-                    "has_og_image": og_image is not None
-                },
-                "accessibility_analysis": {
-                    "total_images": total_images,
-                    "images_missing_alt": len(images_without_alt),
-                    "images_missing_alt_percentage": round((len(images_without_alt) / total_images * 100), 2) if total_images > 0 else 0,
-                    "inputs_without_labels": len(inputs_without_labels),
-                    "heading_structure": heading_structure
-                },
+                **analysis,
                 "status": "success"
             }, indent=2)
         except requests.RequestException as e:
@@ -123,54 +60,69 @@ class SiteMapTool(BaseTool):
             queue, visited = [url], set()
             max_pages = 25  # Increased limit
             failed_urls = []
+            pool = get_parser_pool()
+            pending = deque()  # (parse future or None if the fetch failed, page URL), in crawl order
             
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
-            
-            while queue and len(visited) < max_pages:
-                current_url = queue.pop(0)
-                if current_url in visited:
-                    continue
-                
-                # Normalize URL
-                if current_url.endswith('/'):
-                    current_url = current_url[:-1]
 
-                visited.add(current_url)
-                logger.info(f"Crawling: {current_url}")
-                
+            def merge_oldest():
+                future, page_url = pending.popleft()
+                if future is None:
+                    failed_urls.append(page_url)
+                    return
                 try:
-                    response = requests.get(current_url, timeout=10, headers=headers)
-                    response.raise_for_status()
+                    links = future.result()
+                except Exception as e:
+                    logger.warning(f"Could not parse {page_url}: {e}")
+                    failed_urls.append(page_url)
+                    return
+
+                for full_url in links:
+                    if (full_url not in visited and 
+                        full_url not in queue and
+                        len(queue) + len(visited) < max_pages):
+                        queue.append(full_url)
+            
+            # Fetching and parsing are pipelined: pages are handed to the parser
+            # pool while the next queued page is fetched, and pool.submit blocks
+            # when too many pages are waiting to be parsed. Results are merged
+            # strictly in crawl order, which makes the discovered pages the same
+            # as a sequential crawl regardless of worker timing.
+            while True:
+                while pending and (pending[0][0] is None or pending[0][0].done()):
+                    merge_oldest()
+
+                if queue and len(visited) < max_pages:
+                    current_url = queue.pop(0)
+                    if current_url in visited:
+                        continue
                     
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    links = soup.find_all('a', href=True)
-                    for link in links:
-                        href = link['href']
-                        
-                        if href.startswith(('mailto:', 'tel:', 'javascript:', '#')):
-                            continue
-                            
-                        full_url = urljoin(base_url, href).split('#')[0]
-                        
-                        if full_url.endswith('/'):
-                            full_url = full_url[:-1]
-                        parsed_url = urlparse(full_url)
-                        if (parsed_url.netloc == urlparse(base_url).netloc and 
-                            full_url not in visited and 
-                            full_url not in queue and
-                            len(queue) + len(visited) < max_pages):
-                            queue.append(full_url)
-                            
-                except requests.RequestException as e:
-                    logger.warning(f"Could not crawl {current_url}: {e}")
-                    failed_urls.append(current_url)
-                time.sleep(0.5)
+                    # Normalize URL
+                    if current_url.endswith('/'):
+                        current_url = current_url[:-1]
+
+                    visited.add(current_url)
+                    logger.info(f"Crawling: {current_url}")
+                    
+                    try:
+                        response = requests.get(current_url, timeout=10, headers=headers)
+                        response.raise_for_status()
+                        pending.append((pool.submit(extract_links, response.content, base_url), current_url))
+                    except requests.RequestException as e:
+                        logger.warning(f"Could not crawl {current_url}: {e}")
+                        pending.append((None, current_url))
+                    time.sleep(0.5)
+                elif pending:
+                    # Nothing left to fetch until the oldest page in flight yields its links
+                    merge_oldest()
+                else:
+                    break
                 
             return json.dumps({
                 "base_url": base_url,
-                "discovered_urls": list(visited),
+                "discovered_urls": sorted(visited),  # Stable order keeps downstream prompts cacheable
                 "total_pages": len(visited),
                 "failed_urls": failed_urls,
                 "status": "success"
@@ -188,6 +140,8 @@ class BrowserTool(BaseTool):
     description: str = "Performs a detailed analysis of a webpage using a headless browser, checking load times, console errors, and link status."
 
     def _run(self, url: str) -> str:
+        from playwright.sync_api import sync_playwright
+
         results = {}
         try:
             with sync_playwright() as p:
@@ -0,0 +1,249 @@
+# src/performance_monitor/tools/html_parser.py
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+
+logger = logging.getLogger(__name__)
+
+# Fetching is still sequential and rate-limited, so a couple of workers keep up
+# with it; more only add process startup cost until fetching is concurrent.
+DEFAULT_PARSER_WORKERS = 2
+
+# Parsing functions run in worker processes, so they take raw HTML bytes and
+# return plain, picklable data instead of BeautifulSoup objects. BeautifulSoup
+# is imported inside them so that importing this module stays cheap.
+
+
+def extract_links(html: bytes, base_url: str) -> List[str]:
+    """Return the normalized internal links found in a page."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    base_netloc = urlparse(base_url).netloc
+    links = {}  # Ordered set
+    for link in soup.find_all('a', href=True):
+        href = link['href']
+
+        if href.startswith(('mailto:', 'tel:', 'javascript:', '#')):
+            continue
+
+        full_url = urljoin(base_url, href).split('#')[0]
+
+        if full_url.endswith('/'):
+            full_url = full_url[:-1]
+        if urlparse(full_url).netloc == base_netloc:
+            links[full_url] = None
+    return list(links)
+
+
+def analyze_page(html: bytes) -> Dict[str, Any]:
+    """Return the SEO and accessibility fields of a page."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    title = soup.find('title')
+    title_text = title.get_text(strip=True) if title else 'Not Found'
+    title_length = len(title_text) if title_text != 'Not Found' else 0
+
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    meta_description = meta_desc.get('content', '').strip() if meta_desc else 'Not Found'
+    meta_desc_length = len(meta_description) if meta_description != 'Not Found' else 0
+
+    h1_tags = soup.find_all('h1')
+    h1_content = [h1.get_text(strip=True) for h1 in h1_tags]
+
+    meta_robots = soup.find('meta', attrs={'name': 'robots'})
+    robots_content = meta_robots.get('content', '') if meta_robots else 'Not Found'
+
+    og_title = soup.find('meta', property='og:title')
+    og_description = soup.find('meta', property='og:description')
+    og_image = soup.find('meta', property='og:image')
+
+    images = soup.find_all('img')
+    images_without_alt = []
+    total_images = len(images)
+
+    for img in images:
+        alt_text = img.get('alt', '').strip()
+        if not alt_text:
+            src = img.get('src', 'Unknown source')
+            images_without_alt.append(src)
+
+    forms = soup.find_all('form')
+    inputs_without_labels = []
+    for form in forms:
+        inputs = form.find_all('input', type=['text', 'email', 'password', 'tel', 'url'])
+        for input_elem in inputs:
+            input_id = input_elem.get('id')
+            input_name = input_elem.get('name')
+            if input_id:
+                label = soup.find('label', attrs={'for': input_id})
+                if not label:
+                    inputs_without_labels.append(input_id or input_name or 'Unknown input')
+
+    headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+    heading_structure = []
+    for heading in headings:
+        heading_structure.append({
+            'level': heading.name,
+            'text': heading.get_text(strip=True)[:100]
+        })
+
+    return {
+        "seo_analysis": {
+            "title": title_text,
+            "title_length": title_length,
+            "title_optimal": 30 <= title_length <= 60,
+            "meta_description": meta_description,
+            "meta_description_length": meta_desc_length,
+            "meta_description_optimal": 120 <= meta_desc_length <= 160,
+            "h1_count": len(h1_content),
+            "h1_content": h1_content,
+            "h1_optimal": len(h1_content) == 1,
+            "robots_directive": robots_content,
+            "has_og_title": og_title is not None,
+            "has_og_description": og_description is not None,
+            "has_og_image": og_image is not None
+        },
+        "accessibility_analysis": {
+            "total_images": total_images,
+            "images_missing_alt": len(images_without_alt),
+            "images_missing_alt_percentage": round((len(images_without_alt) / total_images * 100), 2) if total_images > 0 else 0,
+            "inputs_without_labels": len(inputs_without_labels),
+            "heading_structure": heading_structure
+        }
+    }
+
+
+class HtmlParserPool:
+    """Process pool for CPU-bound HTML parsing with a bound on in-flight pages.
+
+    `submit` blocks once `max_pending` pages are queued or being parsed, which
+    holds back the fetch stage until the workers catch up. With `workers=0`
+    parsing runs inline in the calling process.
+
+    If a worker dies (e.g. out of memory on a huge page) the executor is
+    replaced and each affected page is retried once in the new one.
+
+    `workers` defaults to DEFAULT_PARSER_WORKERS rather than the CPU count:
+    pages are fetched one at a time with a politeness delay, so extra workers
+    would sit idle. Raise it once fetching is concurrent.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None):
+        if workers is None:
+            workers = DEFAULT_PARSER_WORKERS
+        if not isinstance(workers, int) or workers < 0:
+            raise ValueError(f"Parser workers must be a non-negative integer, got {workers!r}")
+        if max_pending is not None and (not isinstance(max_pending, int) or max_pending < 1):
+            raise ValueError(f"Parser max_pending must be a positive integer, got {max_pending!r}")
+
+        self.workers = workers
+        self.max_pending = max_pending or max(self.workers, 1) * 2
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        if self.workers <= 0:
+            future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        self._slots.acquire()
+        future = Future()
+        # The slot is held until the page's final result, including a retry
+        future.add_done_callback(lambda _: self._slots.release())
+        self._dispatch(future, fn, args, retries=1)
+        return future
+
+    def _dispatch(self, future: Future, fn: Callable[..., Any], args: tuple, retries: int) -> None:
+        executor = self._get_executor()
+        try:
+            task = executor.submit(fn, *args)
+        except BrokenProcessPool as e:
+            self._discard(executor)
+            if retries:
+                self._dispatch(future, fn, args, retries - 1)
+            else:
+                future.set_exception(e)
+            return
+
+        def _done(task: Future) -> None:
+            try:
+                future.set_result(task.result())
+            except BrokenProcessPool as e:
+                self._discard(executor)
+                if retries:
+                    logger.warning("HTML parser worker died, retrying in a new pool")
+                    self._dispatch(future, fn, args, retries - 1)
+                else:
+                    future.set_exception(e)
+            except Exception as e:
+                future.set_exception(e)
+
+        task.add_done_callback(_done)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Forking a process that already runs threads (Streamlit, crewAI
+                # telemetry, SQLite) is unsafe, so workers come from a forkserver
+                # (or are spawned where forkserver is unavailable, e.g. Windows)
+                start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(start_method)
+                )
+            return self._executor
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        """Drop a broken executor so the next submit starts a fresh one."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pool: Optional[HtmlParserPool] = None
+_pool_lock = threading.Lock()
+
+
+def _int_from_env(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+def get_parser_pool() -> HtmlParserPool:
+    """Return the shared parser pool, configured from PARSER_WORKERS and PARSER_MAX_PENDING."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HtmlParserPool(
+                workers=_int_from_env("PARSER_WORKERS"),
+                max_pending=_int_from_env("PARSER_MAX_PENDING")
+            )
+            logger.info(f"Created HTML parser pool with {_pool.workers} workers (max {_pool.max_pending} pending)")
+            atexit.register(_pool.shutdown)
+        return _pool
@@ -0,0 +1,112 @@
+import sqlite3
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from crewai.llms.base_llm import BaseLLM
+
+from src.performance_monitor.cached_llm import CachedLLM
+from src.performance_monitor.llm_cache import LLMResponseCache
+
+
+class RecordingLLM(BaseLLM):
+    def __init__(self):
+        super().__init__(model="gpt-4o", temperature=0.1)
+        self.calls = []
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, from_task=None, from_agent=None):
+        self.calls.append({
+            "messages": messages,
+            "stop": list(self.stop),
+            "callbacks": callbacks,
+            "from_task": from_task,
+            "from_agent": from_agent,
+        })
+        return f"answer {len(self.calls)}"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3")
+    yield cache
+    cache.close()
+
+
+def make_llm(cache):
+    llm = CachedLLM(RecordingLLM(), cache, provider="openai")
+    # CrewAgentExecutor sets stop words from a set, so their order varies
+    llm.stop = ["\nObservation:", "\nThought:"]
+    return llm
+
+
+def test_executor_style_call_forwards_to_inner_llm(cache):
+    llm = make_llm(cache)
+    callbacks = [object()]
+    task, agent = object(), object()
+    messages = [{"role": "user", "content": "Crawl https://example.com"}]
+
+    # Mirrors crewai.utilities.agent_utils.get_llm_response
+    answer = llm.call(messages, callbacks=callbacks, from_task=task, from_agent=agent)
+
+    assert answer == "answer 1"
+    call = llm.llm.calls[0]
+    assert call["callbacks"] is callbacks
+    assert call["from_task"] is task
+    assert call["from_agent"] is agent
+    assert call["stop"] == ["\nObservation:", "\nThought:"]
+
+
+def test_repeat_run_is_answered_from_cache(cache):
+    messages = [{"role": "user", "content": "Crawl https://example.com"}]
+
+    first_run = make_llm(cache)
+    assert first_run.call(messages, callbacks=[], from_task=None, from_agent=None) == "answer 1"
+
+    second_run = make_llm(cache)
+    second_run.stop = list(reversed(second_run.stop))
+    assert second_run.call(messages, callbacks=[], from_task=None, from_agent=None) == "answer 1"
+    assert second_run.llm.calls == []
+    assert cache.stats()["hits"] == 1
+
+
+def test_native_tool_calls_bypass_cache(cache):
+    llm = make_llm(cache)
+    messages = [{"role": "user", "content": "Crawl https://example.com"}]
+    tools = [{"type": "function", "function": {"name": "site_map"}}]
+
+    llm.call(messages, tools=tools, available_functions={"site_map": len})
+    llm.call(messages, tools=tools, available_functions={"site_map": len})
+
+    assert len(llm.llm.calls) == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_capabilities_come_from_inner_llm(cache):
+    llm = make_llm(cache)
+    assert llm.model == "gpt-4o"
+    assert llm.temperature == 0.1
+    assert llm.supports_stop_words() is True
+    assert llm.get_context_window_size() == llm.llm.get_context_window_size()
+
+
+def test_locked_cache_fails_open(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3", busy_timeout=0.1)
+    messages = [{"role": "user", "content": "Crawl https://example.com"}]
+    make_llm(cache).call(messages)
+
+    other = sqlite3.connect(str(cache.path), isolation_level=None)
+    other.execute("BEGIN EXCLUSIVE")
+    try:
+        llm = make_llm(cache)
+        # The hit can't refresh its access time, so it counts as a miss
+        assert llm.call(messages) == "answer 1"
+        # The write for a new prompt is skipped
+        assert llm.call("new prompt") == "answer 2"
+        assert len(llm.llm.calls) == 2
+    finally:
+        other.rollback()
+        other.close()
+
+    assert cache.get(LLMResponseCache.make_key("openai", "gpt-4o", 0.1, {"messages": "new prompt", "stop": sorted(make_llm(cache).stop)})) is None
+    cache.close()
@@ -0,0 +1,97 @@
+import pytest
+
+pytest.importorskip("crewai")
+pytest.importorskip("langchain_openai")
+
+import crewai
+
+from src.performance_monitor.cached_llm import CachedLLM
+from src.performance_monitor.crew import PerformanceMonitorCrew
+from src.performance_monitor.llm_cache import LLMResponseCache
+from src.performance_monitor.tools import html_parser
+
+
+@pytest.fixture(autouse=True)
+def openai_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("LLM_CACHE_ENABLED", raising=False)
+    monkeypatch.delenv("CREW_MEMORY_ENABLED", raising=False)
+    monkeypatch.delenv("SERPER_API_KEY", raising=False)
+    monkeypatch.delenv("PARSER_WORKERS", raising=False)
+    monkeypatch.delenv("PARSER_MAX_PENDING", raising=False)
+    monkeypatch.setattr(html_parser, "_pool", None)
+
+
+class FakeCrew:
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        FakeCrew.instances.append(self)
+
+    def kickoff(self, inputs):
+        return "report"
+
+
+@pytest.fixture
+def fake_crew(monkeypatch):
+    FakeCrew.instances = []
+    monkeypatch.setattr(crewai, "Crew", FakeCrew)
+    return FakeCrew
+
+
+def test_unusable_cache_dir_falls_back_to_plain_llm(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("LLM_CACHE_DIR", str(blocker / "cache"))
+
+    crew = PerformanceMonitorCrew("https://example.com")
+
+    assert crew.llm_cache is None
+    assert not isinstance(crew.llm, CachedLLM)
+
+
+def test_failed_llm_setup_leaves_no_connection_open(monkeypatch):
+    caches = []
+    from_env = LLMResponseCache.from_env.__func__
+
+    def recording_from_env(cls):
+        caches.append(from_env(cls))
+        return caches[-1]
+
+    monkeypatch.setattr(LLMResponseCache, "from_env", classmethod(recording_from_env))
+    monkeypatch.setenv("LLM_PROVIDER", "unknown")
+
+    with pytest.raises(ValueError, match="Unsupported LLM provider"):
+        PerformanceMonitorCrew("https://example.com")
+    assert caches[0]._conn is None
+
+
+def test_run_keeps_memory_and_can_run_twice(fake_crew):
+    crew = PerformanceMonitorCrew("https://example.com")
+    assert isinstance(crew.llm, CachedLLM)
+
+    assert crew.run() == "report"
+    assert crew.run() == "report"
+
+    assert [instance.kwargs["memory"] for instance in fake_crew.instances] == [True, True]
+    assert crew.llm_cache._conn is None
+    assert crew.llm_cache.stats()["entries"] == 0
+
+
+def test_crew_memory_can_be_disabled(fake_crew, monkeypatch):
+    monkeypatch.setenv("CREW_MEMORY_ENABLED", "false")
+
+    PerformanceMonitorCrew("https://example.com").run()
+
+    assert fake_crew.instances[0].kwargs["memory"] is False
+
+
+def test_invalid_parser_settings_fail_before_kickoff(fake_crew, monkeypatch):
+    monkeypatch.setenv("PARSER_WORKERS", "many")
+
+    with pytest.raises(ValueError, match="PARSER_WORKERS must be an integer, got 'many'"):
+        PerformanceMonitorCrew("https://example.com").run()
+    assert fake_crew.instances == []
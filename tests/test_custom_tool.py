@@ -0,0 +1,53 @@
+import json
+import time
+import types
+
+import pytest
+
+pytest.importorskip("crewai")
+pytest.importorskip("bs4")
+
+from src.performance_monitor.tools import custom_tool
+from src.performance_monitor.tools.html_parser import HtmlParserPool
+
+BASE_URL = "https://example.com"
+
+
+def fake_get(url, timeout=None, headers=None):
+    """Serve a site where page N links to 2N+1, 2N+2, back to N//2, and a long tail.
+
+    Fetches take a few milliseconds and pages vary a lot in parse cost, so
+    parse results complete in a different order relative to fetches each run.
+    """
+    time.sleep(0.003)
+    path = url[len(BASE_URL):].strip('/')
+    if path == "p3":
+        raise custom_tool.requests.ConnectionError("connection reset")
+    n = int(path[1:]) if path else 0
+    links = [f"/p{2 * n + 1}", f"/p{2 * n + 2}/", f"/p{n // 2}", "https://other.org/"]
+    links += [f"/p{n * 7 + i}" for i in range(3)]
+    filler = "".join(f"<p>{'x' * 50}</p>" for _ in range(1500 * (n % 4)))
+    html = "<html><body>" + "".join(f'<a href="{href}">link</a>' for href in links) + filler + "</body></html>"
+    return types.SimpleNamespace(content=html.encode(), raise_for_status=lambda: None)
+
+
+def crawl(monkeypatch, pool):
+    monkeypatch.setattr(custom_tool.requests, "get", fake_get)
+    monkeypatch.setattr(custom_tool, "time", types.SimpleNamespace(sleep=lambda _: None))
+    monkeypatch.setattr(custom_tool, "get_parser_pool", lambda: pool)
+    return json.loads(custom_tool.SiteMapTool()._run(BASE_URL))
+
+
+def test_site_map_is_independent_of_worker_count(monkeypatch):
+    inline = crawl(monkeypatch, HtmlParserPool(workers=0))
+    assert inline["status"] == "success"
+    assert inline["total_pages"] == 25
+    assert inline["failed_urls"] == [f"{BASE_URL}/p3"]
+
+    for workers in (1, 4):
+        pool = HtmlParserPool(workers=workers, max_pending=3)
+        try:
+            for _ in range(3):
+                assert crawl(monkeypatch, pool) == inline
+        finally:
+            pool.shutdown()
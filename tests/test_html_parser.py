@@ -0,0 +1,221 @@
+import os
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urljoin, urlparse
+
+import pytest
+
+bs4 = pytest.importorskip("bs4")
+
+from src.performance_monitor.tools import html_parser
+from src.performance_monitor.tools.html_parser import HtmlParserPool, analyze_page, extract_links, get_parser_pool
+
+PAGE = b"""
+<html>
+<head>
+  <title>Example Domain - a page used for parser tests</title>
+  <meta name="description" content="A short description.">
+  <meta name="robots" content="index, follow">
+  <meta property="og:title" content="Example">
+  <meta property="og:image" content="/og.png">
+</head>
+<body>
+  <h1>Welcome</h1>
+  <h2>Section <em>one</em></h2>
+  <h1>Second heading</h1>
+  <a href="/about">About</a>
+  <a href="/about/">About again</a>
+  <a href="docs#intro">Docs</a>
+  <a href="https://example.com/contact#form">Contact</a>
+  <a href="https://other.org/page">External</a>
+  <a href="mailto:hi@example.com">Mail</a>
+  <a href="tel:123">Call</a>
+  <a href="javascript:void(0)">JS</a>
+  <a href="#top">Top</a>
+  <a>No href</a>
+  <img src="/a.png" alt="A">
+  <img src="/b.png" alt="  ">
+  <img src="/c.png">
+  <form>
+    <label for="email">Email</label>
+    <input id="email" type="email">
+    <input id="phone" name="phone" type="tel">
+    <input name="nickname" type="text">
+    <input id="hidden" type="hidden">
+  </form>
+</body>
+</html>
+"""
+
+
+def legacy_links(html, base_url, visited=(), queue=(), max_pages=25):
+    """SiteMapTool's link handling before parsing moved to html_parser."""
+    from bs4 import BeautifulSoup
+
+    queue = list(queue)
+    soup = BeautifulSoup(html, 'html.parser')
+    for link in soup.find_all('a', href=True):
+        href = link['href']
+        if href.startswith(('mailto:', 'tel:', 'javascript:', '#')):
+            continue
+        full_url = urljoin(base_url, href).split('#')[0]
+        if full_url.endswith('/'):
+            full_url = full_url[:-1]
+        parsed_url = urlparse(full_url)
+        if (parsed_url.netloc == urlparse(base_url).netloc and
+            full_url not in visited and
+            full_url not in queue and
+            len(queue) + len(visited) < max_pages):
+            queue.append(full_url)
+    return queue
+
+
+def legacy_analysis(html):
+    """ScraperTool's analysis before parsing moved to html_parser."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    title = soup.find('title')
+    title_text = title.get_text(strip=True) if title else 'Not Found'
+    title_length = len(title_text) if title_text != 'Not Found' else 0
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    meta_description = meta_desc.get('content', '').strip() if meta_desc else 'Not Found'
+    meta_desc_length = len(meta_description) if meta_description != 'Not Found' else 0
+    h1_content = [h1.get_text(strip=True) for h1 in soup.find_all('h1')]
+    meta_robots = soup.find('meta', attrs={'name': 'robots'})
+    robots_content = meta_robots.get('content', '') if meta_robots else 'Not Found'
+    og_title = soup.find('meta', property='og:title')
+    og_description = soup.find('meta', property='og:description')
+    og_image = soup.find('meta', property='og:image')
+    images = soup.find_all('img')
+    images_without_alt = [img.get('src', 'Unknown source') for img in images if not img.get('alt', '').strip()]
+    total_images = len(images)
+    inputs_without_labels = []
+    for form in soup.find_all('form'):
+        for input_elem in form.find_all('input', type=['text', 'email', 'password', 'tel', 'url']):
+            input_id = input_elem.get('id')
+            input_name = input_elem.get('name')
+            if input_id and not soup.find('label', attrs={'for': input_id}):
+                inputs_without_labels.append(input_id or input_name or 'Unknown input')
+    heading_structure = [
+        {'level': heading.name, 'text': heading.get_text(strip=True)[:100]}
+        for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+    ]
+    return {
+        "seo_analysis": {
+            "title": title_text,
+            "title_length": title_length,
+            "title_optimal": 30 <= title_length <= 60,
+            "meta_description": meta_description,
+            "meta_description_length": meta_desc_length,
+            "meta_description_optimal": 120 <= meta_desc_length <= 160,
+            "h1_count": len(h1_content),
+            "h1_content": h1_content,
+            "h1_optimal": len(h1_content) == 1,
+            "robots_directive": robots_content,
+            "has_og_title": og_title is not None,
+            "has_og_description": og_description is not None,
+            "has_og_image": og_image is not None
+        },
+        "accessibility_analysis": {
+            "total_images": total_images,
+            "images_missing_alt": len(images_without_alt),
+            "images_missing_alt_percentage": round((len(images_without_alt) / total_images * 100), 2) if total_images > 0 else 0,
+            "inputs_without_labels": len(inputs_without_labels),
+            "heading_structure": heading_structure
+        }
+    }
+
+
+def test_extract_links_matches_legacy_crawler():
+    base_url = "https://example.com"
+    assert extract_links(PAGE, base_url) == legacy_links(PAGE, base_url)
+    assert extract_links(PAGE, base_url) == [
+        "https://example.com/about",
+        "https://example.com/docs",
+        "https://example.com/contact",
+    ]
+
+
+def test_analyze_page_matches_legacy_scraper():
+    assert analyze_page(PAGE) == legacy_analysis(PAGE)
+    assert analyze_page(b"") == legacy_analysis(b"")
+
+
+def test_pool_defaults_to_a_small_worker_count():
+    pool = HtmlParserPool()
+
+    assert pool.workers == html_parser.DEFAULT_PARSER_WORKERS
+    assert pool.max_pending == pool.workers * 2
+
+
+@pytest.mark.parametrize("workers, max_pending, message", [
+    (-1, None, "workers must be a non-negative integer"),
+    (1.5, None, "workers must be a non-negative integer"),
+    (1, -2, "max_pending must be a positive integer"),
+    (1, 0, "max_pending must be a positive integer"),
+])
+def test_pool_rejects_invalid_settings(workers, max_pending, message):
+    with pytest.raises(ValueError, match=message):
+        HtmlParserPool(workers=workers, max_pending=max_pending)
+
+
+@pytest.mark.parametrize("name, value", [("PARSER_WORKERS", "four"), ("PARSER_MAX_PENDING", "-1")])
+def test_get_parser_pool_reports_invalid_env(monkeypatch, name, value):
+    monkeypatch.setattr(html_parser, "_pool", None)
+    monkeypatch.setenv(name, value)
+
+    with pytest.raises(ValueError, match=name if value == "four" else "max_pending"):
+        get_parser_pool()
+    assert html_parser._pool is None
+
+
+def test_workers_zero_parses_inline():
+    pool = HtmlParserPool(workers=0)
+
+    future = pool.submit(os.getpid)
+
+    assert future.done()
+    assert future.result() == os.getpid()
+    assert pool._executor is None
+
+
+def test_workers_parse_in_other_processes():
+    pool = HtmlParserPool(workers=1)
+    try:
+        assert pool.submit(os.getpid).result(timeout=30) != os.getpid()
+        assert pool.submit(extract_links, PAGE, "https://example.com").result(timeout=30) == extract_links(PAGE, "https://example.com")
+    finally:
+        pool.shutdown()
+
+
+def test_submit_blocks_at_max_pending():
+    pool = HtmlParserPool(workers=1, max_pending=2)
+    try:
+        pool.submit(os.getpid).result(timeout=30)  # Start the worker outside the timed section
+        first = pool.submit(time.sleep, 1.0)
+        pool.submit(time.sleep, 0)
+
+        submitted = threading.Event()
+        thread = threading.Thread(target=lambda: (pool.submit(os.getpid), submitted.set()))
+        thread.start()
+
+        assert not submitted.wait(0.3)  # Both slots are taken
+        first.result(timeout=30)
+        assert submitted.wait(30)
+        thread.join()
+    finally:
+        pool.shutdown()
+
+
+def test_pool_recovers_after_a_worker_dies():
+    pool = HtmlParserPool(workers=1)
+    try:
+        crash = pool.submit(os._exit, 1)
+        with pytest.raises(BrokenProcessPool):
+            crash.result(timeout=60)
+
+        assert pool.submit(os.getpid).result(timeout=60) != os.getpid()
+    finally:
+        pool.shutdown()
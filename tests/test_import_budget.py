@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.performance_monitor import import_budget
+
+
+@pytest.mark.skipif(
+    not os.getenv("IMPORT_BUDGET_ENFORCE"),
+    reason="wall-clock budget; set IMPORT_BUDGET_ENFORCE=1 to run it on an idle runner"
+)
+def test_entry_points_import_within_budget(capsys):
+    pytest.importorskip("dotenv")
+    pytest.importorskip("streamlit")
+
+    exit_code = import_budget.main()
+
+    assert exit_code == 0, capsys.readouterr().out
+
+
+def test_crew_construction_skips_crewai_when_cache_disabled(tmp_path):
+    pytest.importorskip("langchain_openai")
+
+    code = (
+        "import sys\n"
+        "from src.performance_monitor.crew import PerformanceMonitorCrew\n"
+        "PerformanceMonitorCrew('https://example.com')\n"
+        "heavy = [m for m in ('crewai', 'langchain_google_genai', 'bs4', 'playwright') if m in sys.modules]\n"
+        "assert not heavy, heavy\n"
+    )
+    env = {
+        "LLM_CACHE_ENABLED": "false",
+        "LLM_PROVIDER": "openai",
+        "OPENAI_API_KEY": "test-key",
+        "HOME": str(tmp_path),
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=import_budget.REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
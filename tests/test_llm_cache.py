@@ -0,0 +1,138 @@
+import sqlite3
+
+import pytest
+
+from src.performance_monitor import llm_cache
+from src.performance_monitor.llm_cache import LLMResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=60, max_bytes=1024)
+    yield cache
+    cache.close()
+
+
+def test_make_key_is_stable_and_covers_model_identity():
+    messages = [{"role": "user", "content": "Audit https://example.com"}]
+    key = LLMResponseCache.make_key("openai", "gpt-4o", 0.1, messages)
+
+    assert key == LLMResponseCache.make_key("openai", "gpt-4o", 0.1, [dict(messages[0])])
+    assert key != LLMResponseCache.make_key("gemini", "gpt-4o", 0.1, messages)
+    assert key != LLMResponseCache.make_key("openai", "gpt-4o-mini", 0.1, messages)
+    assert key != LLMResponseCache.make_key("openai", "gpt-4o", 0.2, messages)
+    assert key != LLMResponseCache.make_key("openai", "gpt-4o", 0.1, [{"role": "user", "content": "Audit"}])
+
+
+def test_get_and_set_track_hits_and_misses(cache):
+    assert cache.get("key") is None
+    cache.set("key", "response")
+    assert cache.get("key") == "response"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["entries"] == 1
+    assert stats["size_bytes"] == len("response")
+
+
+def test_entries_expire_after_ttl(cache, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now)
+    cache.set("key", "response")
+
+    now += 59
+    assert cache.get("key") == "response"
+
+    now += 2
+    assert cache.get("key") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entries_are_evicted_over_max_bytes(tmp_path, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now)
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=0, max_bytes=20)
+
+    cache.set("a", "x" * 8)
+    now += 1
+    cache.set("b", "y" * 8)
+    now += 1
+    assert cache.get("a") == "x" * 8  # "b" is now the least recently used entry
+    now += 1
+    cache.set("c", "z" * 8)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "x" * 8
+    assert cache.get("c") == "z" * 8
+    assert cache.stats()["size_bytes"] == 16
+    cache.close()
+
+
+def test_entries_persist_across_instances(tmp_path):
+    first = LLMResponseCache(tmp_path / "cache.sqlite3")
+    first.set("key", "response")
+    first.close()
+
+    second = LLMResponseCache(tmp_path / "cache.sqlite3")
+    assert second.get("key") == "response"
+    second.close()
+
+
+def test_close_releases_the_connection_and_reopens_on_use(cache):
+    cache.set("key", "response")
+    conn = cache._conn
+    cache.close()
+    cache.close()  # Idempotent
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+    assert cache.get("key") == "response"
+    assert cache.stats()["entries"] == 1
+
+
+def test_locked_database_raises_after_busy_timeout(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.sqlite3", busy_timeout=0.1)
+    cache.set("key", "response")
+    other = sqlite3.connect(str(cache.path), isolation_level=None)
+    other.execute("BEGIN EXCLUSIVE")
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            cache.set("other", "response")
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            cache.get("key")  # Refreshing accessed_at needs the write lock
+    finally:
+        other.rollback()
+        other.close()
+
+    # The failed writes were rolled back and the cache is usable again
+    assert cache.get("other") is None
+    assert cache.get("key") == "response"
+    cache.close()
+
+
+def test_from_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "false")
+    assert LLMResponseCache.from_env() is None
+
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "true")
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("LLM_CACHE_TTL_SECONDS", "30")
+    monkeypatch.setenv("LLM_CACHE_MAX_MB", "1")
+    cache = LLMResponseCache.from_env()
+    assert cache.path == tmp_path / "llm_responses.sqlite3"
+    assert cache.path.exists()
+    assert cache._conn is None  # Nothing is held open until first use
+    assert cache.ttl_seconds == 30
+    assert cache.max_bytes == 1024 * 1024
+
+
+def test_from_env_returns_none_when_cache_dir_is_unusable(tmp_path, monkeypatch, caplog):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("LLM_CACHE_DIR", str(blocker / "cache"))
+
+    assert LLMResponseCache.from_env() is None
+    assert "LLM cache disabled" in caplog.text